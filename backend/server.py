@@ -1,28 +1,68 @@
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.security import HTTPBearer
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
+import jwt
+import hashlib
 import os
-from pymongo import MongoClient
+import time
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
 import uuid
-from bson import ObjectId
 import json
+import orjson
 
 # MongoDB connection
 MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017/')
-client = MongoClient(MONGO_URL)
-db = client.archviz_portfolio
 
-# Collections
-projects_collection = db.projects
-blog_collection = db.blog_posts
-testimonials_collection = db.testimonials
-settings_collection = db.settings
-contacts_collection = db.contacts
-
-app = FastAPI(title="Architectural Visualization Portfolio API")
+# Pool bounds are per worker: each Uvicorn worker runs its own client,
+# so total connections are workers x maxPoolSize. The default splits the
+# previous single-worker budget of 50 across the worker count; override
+# via env when the deployment needs different bounds.
+_WORKERS = os.cpu_count() or 1
+MONGO_MAX_POOL = int(os.environ.get('MONGO_MAX_POOL_SIZE',
+                                    str(max(50 // _WORKERS, 5))))
+MONGO_MIN_POOL = int(os.environ.get('MONGO_MIN_POOL_SIZE',
+                                    str(min(MONGO_MAX_POOL, 10))))
+
+# The client and collections are created per worker in startup_event: a
+# client opened at import time would be forked along with the worker
+# processes and end up sharing sockets between them.
+client = None
+db = None
+projects_collection = None
+blog_collection = None
+testimonials_collection = None
+settings_collection = None
+contacts_collection = None
+
+def init_mongo():
+    global client, db, projects_collection, blog_collection, \
+        testimonials_collection, settings_collection, contacts_collection
+    client = AsyncIOMotorClient(
+        MONGO_URL,
+        maxPoolSize=MONGO_MAX_POOL,
+        minPoolSize=MONGO_MIN_POOL,
+        serverSelectionTimeoutMS=2000,
+        connectTimeoutMS=2000,
+        socketTimeoutMS=5000,
+        retryWrites=True,
+    )
+    db = client.archviz_portfolio
+    projects_collection = db.projects
+    blog_collection = db.blog_posts
+    testimonials_collection = db.testimonials
+    settings_collection = db.settings
+    contacts_collection = db.contacts
+
+# orjson serializes datetimes/UUIDs natively and is several times faster
+# than the stdlib encoder on the list endpoints
+app = FastAPI(title="Architectural Visualization Portfolio API",
+              default_response_class=ORJSONResponse)
 
 # CORS middleware
 app.add_middleware(
@@ -35,9 +75,28 @@ app.add_middleware(
 
 security = HTTPBearer()
 
-# Pydantic models
+# Admin tokens are short-lived HS256 JWTs issued by /api/admin/login.
+# The secret is resolved once per process via lru_cache, so verification
+# adds only a decode per authenticated request.
+JWT_ALGORITHM = "HS256"
+TOKEN_TTL = timedelta(hours=12)
+
+@lru_cache(maxsize=1)
+def get_jwt_secret():
+    return os.environ.get('JWT_SECRET', 'archviz-dev-secret')
+
+async def require_auth(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+):
+    try:
+        return jwt.decode(credentials.credentials, get_jwt_secret(),
+                          algorithms=[JWT_ALGORITHM])
+    except jwt.InvalidTokenError:
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+
+# Pydantic models. id is server-assigned and lives only in the DB docs;
+# pydantic v2 ignores unknown fields, so clients echoing id back are fine.
 class Project(BaseModel):
-    id: Optional[str] = None
     title: str
     description: str
     category: str
@@ -47,7 +106,6 @@ class Project(BaseModel):
     created_at: Optional[datetime] = None
 
 class BlogPost(BaseModel):
-    id: Optional[str] = None
     title: str
     content: str
     excerpt: str
@@ -58,7 +116,6 @@ class BlogPost(BaseModel):
     read_time: Optional[int] = 5
 
 class Testimonial(BaseModel):
-    id: Optional[str] = None
     name: str
     company: str
     role: str
@@ -72,6 +129,41 @@ class Contact(BaseModel):
     message: str
     created_at: Optional[datetime] = None
 
+# Partial models for the update endpoints: only the fields a client
+# actually sent are validated and written, so untouched fields cost
+# nothing and the $set payload stays small. extra="forbid" catches typos
+# that a full-replace model would silently drop.
+class ProjectUpdate(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    title: Optional[str] = None
+    description: Optional[str] = None
+    category: Optional[str] = None
+    image_url: Optional[str] = None
+    gallery_images: Optional[List[str]] = None
+    software_used: Optional[List[str]] = None
+
+class BlogPostUpdate(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    title: Optional[str] = None
+    content: Optional[str] = None
+    excerpt: Optional[str] = None
+    image_url: Optional[str] = None
+    category: Optional[str] = None
+    tags: Optional[List[str]] = None
+    read_time: Optional[int] = None
+
+class TestimonialUpdate(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    name: Optional[str] = None
+    company: Optional[str] = None
+    role: Optional[str] = None
+    content: Optional[str] = None
+    image_url: Optional[str] = None
+    rating: Optional[int] = None
+
 class Settings(BaseModel):
     name: str
     title: str
@@ -83,137 +175,241 @@ class Settings(BaseModel):
     location: str
     social_links: dict = {}
 
-# Helper function to convert ObjectId to string
-def serialize_doc(doc):
-    if doc and '_id' in doc:
-        doc['id'] = str(doc['_id'])
-        del doc['_id']
-    return doc
+# List-view projections: only the fields the listing UIs render. Full
+# documents (gallery images, blog body) come from the detail endpoints.
+PROJECT_LIST_FIELDS = {
+    "_id": 0, "id": 1, "title": 1, "description": 1, "category": 1,
+    "image_url": 1, "software_used": 1,
+}
+BLOG_LIST_FIELDS = {
+    "_id": 0, "id": 1, "title": 1, "excerpt": 1, "image_url": 1,
+    "category": 1, "tags": 1, "published_at": 1, "read_time": 1,
+}
+
+# Every document carries a UUID id field, so Mongo's _id is excluded at
+# query time instead of being stripped doc-by-doc in Python
+NO_OBJECT_ID = {"_id": 0}
+
+# In-process TTL cache for hot, rarely-changing GET responses. The short
+# TTL bounds staleness across workers without needing a shared cache;
+# writes invalidate eagerly so single-worker deployments stay fresh.
+CACHE_TTL_SECONDS = 60
+_response_cache = {}
+
+def cache_get(key):
+    entry = _response_cache.get(key)
+    if entry and entry[1] > time.monotonic():
+        return entry[0]
+    return None
+
+def cache_set(key, value):
+    _response_cache[key] = (value, time.monotonic() + CACHE_TTL_SECONDS)
+
+def cache_invalidate(*keys):
+    for key in keys:
+        _response_cache.pop(key, None)
+
+# Browser/CDN caching for the near-static portfolio endpoints; short
+# max-age keeps edits visible quickly while 304s spare repeat visitors
+# the full serialize+send path
+CACHEABLE_HEADERS = {
+    "Cache-Control": "public, max-age=30, stale-while-revalidate=120",
+}
+
+async def etag_response(request: Request, key, fetch):
+    """Serve a memoized (etag, body) pair, querying Mongo only on miss.
+
+    The serialized body and its hash live in the TTL cache together, so
+    the hash is not recomputed per request, and a matching If-None-Match
+    header short-circuits to an empty 304.
+    """
+    entry = cache_get(key)
+    if entry is None:
+        body = orjson.dumps(await fetch())
+        # Entity-tags are quoted strings per RFC 9110
+        digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+        entry = (f'"{digest}"', body)
+        cache_set(key, entry)
+    etag, body = entry
+    headers = {"ETag": etag, **CACHEABLE_HEADERS}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # Intermediaries may send a list and/or weak validators; compare
+        # against each member with any W/ prefix stripped
+        tags = {tag.strip().removeprefix("W/")
+                for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json",
+                    headers=headers)
+
+def stream_json_array(cursor):
+    """Serialize a cursor as a JSON array without materializing it.
+
+    Documents are encoded one at a time as they arrive from the driver,
+    so peak memory stays flat no matter how large the collection grows.
+    """
+    async def body():
+        yield b"["
+        first = True
+        async for doc in cursor.batch_size(100):
+            yield orjson.dumps(doc) if first else b"," + orjson.dumps(doc)
+            first = False
+        yield b"]"
+    return StreamingResponse(body(), media_type="application/json")
 
 # Initialize default data
 @app.on_event("startup")
 async def startup_event():
-    # Check if settings exist, if not create default
-    if not settings_collection.find_one():
-        default_settings = {
-            "name": "Rabiul Hasan",
-            "title": "Architectural Visualizer | AI Enthusiast",
-            "bio": "Creative and detail-oriented Architectural Visualizer with a Diploma in Civil Engineering and certified training under the IsDB-BISEW IT Scholarship. Passionate about leveraging technology and AI to create stunning and realistic architectural representations.",
-            "profile_image": "https://images.unsplash.com/photo-1507003211169-0a1dd7228f2d?w=400&h=400&fit=crop&crop=face",
-            "cv_url": "/downloads/cv.pdf",
-            "email": "rabiul.hasan@example.com",
-            "phone": "+880 1234 567890",
-            "location": "Dhaka, Bangladesh",
-            "social_links": {
-                "linkedin": "https://linkedin.com/in/rabiul-hasan",
-                "behance": "https://behance.net/rabiul-hasan",
-                "instagram": "https://instagram.com/rabiul.archviz",
-                "facebook": "https://facebook.com/rabiul.hasan"
-            }
+    init_mongo()
+
+    # Force the connection handshake now and touch each collection so the
+    # pool is warm before the first real request arrives
+    await client.admin.command('ping')
+    for collection in (projects_collection, blog_collection,
+                       testimonials_collection, settings_collection,
+                       contacts_collection):
+        await collection.find_one()
+
+    # Indexes: id lookups become point queries, category feeds the
+    # categories endpoint, and the descending date indexes back the
+    # sorted list endpoints so Mongo never sorts in memory
+    await projects_collection.create_index("id", unique=True)
+    await projects_collection.create_index("category")
+    await blog_collection.create_index("id", unique=True)
+    await blog_collection.create_index([("published_at", -1)])
+    await testimonials_collection.create_index("id", unique=True)
+    await settings_collection.create_index("id", unique=True)
+    await contacts_collection.create_index([("created_at", -1)])
+
+    # Seeding is idempotent: documents get stable uuid5 ids derived from
+    # their title/name and are written with $setOnInsert upserts, so
+    # multiple workers can start concurrently (and partial deletions be
+    # re-filled) without duplicating seed data
+    default_settings = {
+        "name": "Rabiul Hasan",
+        "title": "Architectural Visualizer | AI Enthusiast",
+        "bio": "Creative and detail-oriented Architectural Visualizer with a Diploma in Civil Engineering and certified training under the IsDB-BISEW IT Scholarship. Passionate about leveraging technology and AI to create stunning and realistic architectural representations.",
+        "profile_image": "https://images.unsplash.com/photo-1507003211169-0a1dd7228f2d?w=400&h=400&fit=crop&crop=face",
+        "cv_url": "/downloads/cv.pdf",
+        "email": "rabiul.hasan@example.com",
+        "phone": "+880 1234 567890",
+        "location": "Dhaka, Bangladesh",
+        "social_links": {
+            "linkedin": "https://linkedin.com/in/rabiul-hasan",
+            "behance": "https://behance.net/rabiul-hasan",
+            "instagram": "https://instagram.com/rabiul.archviz",
+            "facebook": "https://facebook.com/rabiul.hasan"
         }
-        settings_collection.insert_one(default_settings)
-    
-    # Initialize sample projects
-    if projects_collection.count_documents({}) == 0:
-        sample_projects = [
-            {
-                "id": str(uuid.uuid4()),
-                "title": "Cozy Living Room",
-                "description": "An interior design visualization for a cozy and inviting living space. The project focuses on warm lighting, comfortable furniture, and a harmonious color palette.",
-                "category": "Interior Design",
-                "image_url": "https://images.unsplash.com/photo-1749464251742-107093fc5650?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NDQ2Mzl8MHwxfHNlYXJjaHwxfHxhcmNoaXRlY3R1cmFsJTIwdmlzdWFsaXphdGlvbnxlbnwwfHx8fDE3NTI4MTQ0NDJ8MA&ixlib=rb-4.1.0&q=85",
-                "gallery_images": [
-                    "https://images.unsplash.com/photo-1747538454771-c6500c61266d?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NDQ2Mzl8MHwxfHNlYXJjaHwyfHxhcmNoaXRlY3R1cmFsJTIwdmlzdWFsaXphdGlvbnxlbnwwfHx8fDE3NTI4MTQ0NDJ8MA&ixlib=rb-4.1.0&q=85",
-                    "https://images.unsplash.com/photo-1747538454763-3c80e36f17bf?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NDQ2Mzl8MHwxfHNlYXJjaHwzfHxhcmNoaXRlY3R1cmFsJTIwdmlzdWFsaXphdGlvbnxlbnwwfHx8fDE3NTI4MTQ0NDJ8MA&ixlib=rb-4.1.0&q=85"
-                ],
-                "software_used": ["3ds Max", "Corona Renderer", "Photoshop"],
-                "created_at": datetime.now()
-            },
-            {
-                "id": str(uuid.uuid4()),
-                "title": "Modern Villa Exterior",
-                "description": "A photorealistic rendering of a contemporary villa featuring clean lines, large windows, and modern architectural elements.",
-                "category": "Exterior Design",
-                "image_url": "https://images.pexels.com/photos/32984408/pexels-photo-32984408.jpeg",
-                "gallery_images": [
-                    "https://images.unsplash.com/photo-1618221195710-dd6b41faaea6?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NDQ2NDN8MHwxfHNlYXJjaHwyfHxpbnRlcmlvciUyMGRlc2lnbnxlbnwwfHx8fDE3NTI4MTQ0NDh8MA&ixlib=rb-4.1.0&q=85"
-                ],
-                "software_used": ["3ds Max", "V-ray", "AutoCAD"],
-                "created_at": datetime.now()
-            },
-            {
-                "id": str(uuid.uuid4()),
-                "title": "Corporate Office Interior",
-                "description": "Professional office space design emphasizing productivity, comfort, and modern aesthetics.",
-                "category": "Commercial Design",
-                "image_url": "https://images.pexels.com/photos/1571460/pexels-photo-1571460.jpeg",
-                "gallery_images": [],
-                "software_used": ["Revit", "3ds Max", "Lumion"],
-                "created_at": datetime.now()
-            }
-        ]
-        projects_collection.insert_many(sample_projects)
-    
-    # Initialize sample blog posts
-    if blog_collection.count_documents({}) == 0:
-        sample_posts = [
-            {
-                "id": str(uuid.uuid4()),
-                "title": "Mastering Photorealism in 3ds Max and Corona",
-                "content": "Achieving photorealism requires a deep understanding of lighting, materials, and composition. In this tutorial, we walk through the essential techniques in 3ds Max and Corona Renderer to take your visualizations from good to breathtakingly realistic.",
-                "excerpt": "Learn essential techniques for creating photorealistic architectural visualizations using 3ds Max and Corona Renderer.",
-                "image_url": "https://images.unsplash.com/photo-1749464251742-107093fc5650?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NDQ2Mzl8MHwxfHNlYXJjaHwxfHxhcmNoaXRlY3R1cmFsJTIwdmlzdWFsaXphdGlvbnxlbnwwfHx8fDE3NTI4MTQ0NDJ8MA&ixlib=rb-4.1.0&q=85",
-                "category": "Tutorial",
-                "tags": ["3ds Max", "Corona", "Photorealism"],
-                "published_at": datetime.now(),
-                "read_time": 8
-            },
-            {
-                "id": str(uuid.uuid4()),
-                "title": "The Future of AI in Architectural Visualization",
-                "content": "Artificial Intelligence is revolutionizing architectural visualization, from automated material generation to intelligent lighting solutions. Explore how AI tools are transforming our workflow and enhancing creative possibilities.",
-                "excerpt": "Discover how AI is transforming the architectural visualization industry and what it means for designers.",
-                "image_url": "https://images.unsplash.com/photo-1747538454771-c6500c61266d?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NDQ2Mzl8MHwxfHNlYXJjaHwyfHxhcmNoaXRlY3R1cmFsJTIwdmlzdWFsaXphdGlvbnxlbnwwfHx8fDE3NTI4MTQ0NDJ8MA&ixlib=rb-4.1.0&q=85",
-                "category": "Technology",
-                "tags": ["AI", "Future", "Innovation"],
-                "published_at": datetime.now(),
-                "read_time": 6
-            }
-        ]
-        blog_collection.insert_many(sample_posts)
-    
-    # Initialize sample testimonials
-    if testimonials_collection.count_documents({}) == 0:
-        sample_testimonials = [
-            {
-                "id": str(uuid.uuid4()),
-                "name": "Sarah Johnson",
-                "company": "Modern Architecture Studio",
-                "role": "Principal Architect",
-                "content": "Rabiul's architectural visualizations are exceptional. His attention to detail and ability to bring our designs to life is remarkable. The photorealistic quality of his work has helped us win several major projects.",
-                "image_url": "https://images.unsplash.com/photo-1494790108755-2616b612b390?w=150&h=150&fit=crop&crop=face",
-                "rating": 5
-            },
-            {
-                "id": str(uuid.uuid4()),
-                "name": "Michael Chen",
-                "company": "Urban Design Group",
-                "role": "Creative Director",
-                "content": "Working with Rabiul has been a game-changer for our firm. His technical expertise in 3ds Max and Corona, combined with his artistic vision, produces stunning visualizations that exceed client expectations.",
-                "image_url": "https://images.unsplash.com/photo-1472099645785-5658abf4ff4e?w=150&h=150&fit=crop&crop=face",
-                "rating": 5
-            },
-            {
-                "id": str(uuid.uuid4()),
-                "name": "Emma Rodriguez",
-                "company": "Residential Designs Inc.",
-                "role": "Interior Designer",
-                "content": "Rabiul's interior visualizations are incredibly realistic and help our clients visualize their future spaces perfectly. His understanding of lighting and materials is outstanding.",
-                "image_url": "https://images.unsplash.com/photo-1438761681033-6461ffad8d80?w=150&h=150&fit=crop&crop=face",
-                "rating": 5
-            }
-        ]
-        testimonials_collection.insert_many(sample_testimonials)
+    }
+    # The upsert is keyed on a fixed id backed by the unique index above:
+    # an empty-filter upsert has no index to serialize on, so two workers
+    # starting together could both insert. Legacy docs predate the id
+    # field, so tag them first to keep the keyed filter matching.
+    await settings_collection.update_one(
+        {"id": {"$exists": False}}, {"$set": {"id": "settings"}}
+    )
+    await settings_collection.update_one(
+        {"id": "settings"}, {"$setOnInsert": default_settings}, upsert=True
+    )
+
+    sample_projects = [
+        {
+            "title": "Cozy Living Room",
+            "description": "An interior design visualization for a cozy and inviting living space. The project focuses on warm lighting, comfortable furniture, and a harmonious color palette.",
+            "category": "Interior Design",
+            "image_url": "https://images.unsplash.com/photo-1749464251742-107093fc5650?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NDQ2Mzl8MHwxfHNlYXJjaHwxfHxhcmNoaXRlY3R1cmFsJTIwdmlzdWFsaXphdGlvbnxlbnwwfHx8fDE3NTI4MTQ0NDJ8MA&ixlib=rb-4.1.0&q=85",
+            "gallery_images": [
+                "https://images.unsplash.com/photo-1747538454771-c6500c61266d?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NDQ2Mzl8MHwxfHNlYXJjaHwyfHxhcmNoaXRlY3R1cmFsJTIwdmlzdWFsaXphdGlvbnxlbnwwfHx8fDE3NTI4MTQ0NDJ8MA&ixlib=rb-4.1.0&q=85",
+                "https://images.unsplash.com/photo-1747538454763-3c80e36f17bf?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NDQ2Mzl8MHwxfHNlYXJjaHwzfHxhcmNoaXRlY3R1cmFsJTIwdmlzdWFsaXphdGlvbnxlbnwwfHx8fDE3NTI4MTQ0NDJ8MA&ixlib=rb-4.1.0&q=85"
+            ],
+            "software_used": ["3ds Max", "Corona Renderer", "Photoshop"],
+            "created_at": datetime.utcnow()
+        },
+        {
+            "title": "Modern Villa Exterior",
+            "description": "A photorealistic rendering of a contemporary villa featuring clean lines, large windows, and modern architectural elements.",
+            "category": "Exterior Design",
+            "image_url": "https://images.pexels.com/photos/32984408/pexels-photo-32984408.jpeg",
+            "gallery_images": [
+                "https://images.unsplash.com/photo-1618221195710-dd6b41faaea6?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NDQ2NDN8MHwxfHNlYXJjaHwyfHxpbnRlcmlvciUyMGRlc2lnbnxlbnwwfHx8fDE3NTI4MTQ0NDh8MA&ixlib=rb-4.1.0&q=85"
+            ],
+            "software_used": ["3ds Max", "V-ray", "AutoCAD"],
+            "created_at": datetime.utcnow()
+        },
+        {
+            "title": "Corporate Office Interior",
+            "description": "Professional office space design emphasizing productivity, comfort, and modern aesthetics.",
+            "category": "Commercial Design",
+            "image_url": "https://images.pexels.com/photos/1571460/pexels-photo-1571460.jpeg",
+            "gallery_images": [],
+            "software_used": ["Revit", "3ds Max", "Lumion"],
+            "created_at": datetime.utcnow()
+        }
+    ]
+
+    sample_posts = [
+        {
+            "title": "Mastering Photorealism in 3ds Max and Corona",
+            "content": "Achieving photorealism requires a deep understanding of lighting, materials, and composition. In this tutorial, we walk through the essential techniques in 3ds Max and Corona Renderer to take your visualizations from good to breathtakingly realistic.",
+            "excerpt": "Learn essential techniques for creating photorealistic architectural visualizations using 3ds Max and Corona Renderer.",
+            "image_url": "https://images.unsplash.com/photo-1749464251742-107093fc5650?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NDQ2Mzl8MHwxfHNlYXJjaHwxfHxhcmNoaXRlY3R1cmFsJTIwdmlzdWFsaXphdGlvbnxlbnwwfHx8fDE3NTI4MTQ0NDJ8MA&ixlib=rb-4.1.0&q=85",
+            "category": "Tutorial",
+            "tags": ["3ds Max", "Corona", "Photorealism"],
+            "published_at": datetime.utcnow(),
+            "read_time": 8
+        },
+        {
+            "title": "The Future of AI in Architectural Visualization",
+            "content": "Artificial Intelligence is revolutionizing architectural visualization, from automated material generation to intelligent lighting solutions. Explore how AI tools are transforming our workflow and enhancing creative possibilities.",
+            "excerpt": "Discover how AI is transforming the architectural visualization industry and what it means for designers.",
+            "image_url": "https://images.unsplash.com/photo-1747538454771-c6500c61266d?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NDQ2Mzl8MHwxfHNlYXJjaHwyfHxhcmNoaXRlY3R1cmFsJTIwdmlzdWFsaXphdGlvbnxlbnwwfHx8fDE3NTI4MTQ0NDJ8MA&ixlib=rb-4.1.0&q=85",
+            "category": "Technology",
+            "tags": ["AI", "Future", "Innovation"],
+            "published_at": datetime.utcnow(),
+            "read_time": 6
+        }
+    ]
+
+    sample_testimonials = [
+        {
+            "name": "Sarah Johnson",
+            "company": "Modern Architecture Studio",
+            "role": "Principal Architect",
+            "content": "Rabiul's architectural visualizations are exceptional. His attention to detail and ability to bring our designs to life is remarkable. The photorealistic quality of his work has helped us win several major projects.",
+            "image_url": "https://images.unsplash.com/photo-1494790108755-2616b612b390?w=150&h=150&fit=crop&crop=face",
+            "rating": 5
+        },
+        {
+            "name": "Michael Chen",
+            "company": "Urban Design Group",
+            "role": "Creative Director",
+            "content": "Working with Rabiul has been a game-changer for our firm. His technical expertise in 3ds Max and Corona, combined with his artistic vision, produces stunning visualizations that exceed client expectations.",
+            "image_url": "https://images.unsplash.com/photo-1472099645785-5658abf4ff4e?w=150&h=150&fit=crop&crop=face",
+            "rating": 5
+        },
+        {
+            "name": "Emma Rodriguez",
+            "company": "Residential Designs Inc.",
+            "role": "Interior Designer",
+            "content": "Rabiul's interior visualizations are incredibly realistic and help our clients visualize their future spaces perfectly. His understanding of lighting and materials is outstanding.",
+            "image_url": "https://images.unsplash.com/photo-1438761681033-6461ffad8d80?w=150&h=150&fit=crop&crop=face",
+            "rating": 5
+        }
+    ]
+
+    for docs, key, collection in (
+        (sample_projects, "title", projects_collection),
+        (sample_posts, "title", blog_collection),
+        (sample_testimonials, "name", testimonials_collection),
+    ):
+        for doc in docs:
+            doc["id"] = str(uuid.uuid5(uuid.NAMESPACE_DNS, doc[key]))
+        await collection.bulk_write(
+            [UpdateOne({"id": doc["id"]}, {"$setOnInsert": doc}, upsert=True)
+             for doc in docs],
+            ordered=False,
+        )
 
 # API Routes
 @app.get("/")
@@ -222,134 +418,168 @@ async def root():
 
 # Projects endpoints
 @app.get("/api/projects")
-async def get_projects():
-    projects = list(projects_collection.find())
-    return [serialize_doc(project) for project in projects]
+async def get_projects(request: Request):
+    async def fetch():
+        cursor = projects_collection.find({}, PROJECT_LIST_FIELDS)
+        return [project async for project in cursor]
+    return await etag_response(request, "projects", fetch)
 
 @app.get("/api/projects/categories")
 async def get_project_categories():
-    categories = projects_collection.distinct("category")
+    categories = cache_get("project_categories")
+    if categories is None:
+        # $group runs over the category index keys (DISTINCT_SCAN) and
+        # gives the UI a document count per category for filter chips
+        pipeline = [
+            {"$group": {"_id": "$category", "count": {"$sum": 1}}},
+            {"$sort": {"_id": 1}},
+        ]
+        categories = [
+            {"name": row["_id"], "count": row["count"]}
+            async for row in projects_collection.aggregate(pipeline)
+        ]
+        cache_set("project_categories", categories)
     return categories
 
 @app.get("/api/projects/{project_id}")
 async def get_project(project_id: str):
-    project = projects_collection.find_one({"id": project_id})
+    project = await projects_collection.find_one({"id": project_id}, NO_OBJECT_ID)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    return serialize_doc(project)
+    return project
 
-@app.post("/api/projects")
+@app.post("/api/projects", dependencies=[Depends(require_auth)])
 async def create_project(project: Project):
-    project.id = str(uuid.uuid4())
-    project.created_at = datetime.now()
-    result = projects_collection.insert_one(project.dict())
-    return {"id": project.id, "message": "Project created successfully"}
-
-@app.put("/api/projects/{project_id}")
-async def update_project(project_id: str, project: Project):
-    result = projects_collection.update_one(
-        {"id": project_id}, 
-        {"$set": project.dict(exclude={"id"})}
+    doc = {**project.model_dump(), "id": str(uuid.uuid4()),
+           "created_at": datetime.utcnow()}
+    await projects_collection.insert_one(doc)
+    cache_invalidate("projects", "project_categories")
+    return {"id": doc["id"], "message": "Project created successfully"}
+
+@app.put("/api/projects/{project_id}", dependencies=[Depends(require_auth)])
+async def update_project(project_id: str, project: ProjectUpdate):
+    changes = project.model_dump(exclude_unset=True)
+    if not changes:
+        return {"message": "No changes supplied"}
+    result = await projects_collection.update_one(
+        {"id": project_id},
+        {"$set": changes}
     )
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Project not found")
+    cache_invalidate("projects", "project_categories")
     return {"message": "Project updated successfully"}
 
-@app.delete("/api/projects/{project_id}")
+@app.delete("/api/projects/{project_id}", dependencies=[Depends(require_auth)])
 async def delete_project(project_id: str):
-    result = projects_collection.delete_one({"id": project_id})
+    result = await projects_collection.delete_one({"id": project_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Project not found")
+    cache_invalidate("projects", "project_categories")
     return {"message": "Project deleted successfully"}
 
 # Blog endpoints
 @app.get("/api/blog")
 async def get_blog_posts():
-    posts = list(blog_collection.find().sort("published_at", -1))
-    return [serialize_doc(post) for post in posts]
+    cursor = blog_collection.find({}, BLOG_LIST_FIELDS).sort("published_at", -1)
+    return stream_json_array(cursor)
 
 @app.get("/api/blog/{post_id}")
 async def get_blog_post(post_id: str):
-    post = blog_collection.find_one({"id": post_id})
+    post = await blog_collection.find_one({"id": post_id}, NO_OBJECT_ID)
     if not post:
         raise HTTPException(status_code=404, detail="Blog post not found")
-    return serialize_doc(post)
+    return post
 
-@app.post("/api/blog")
+@app.post("/api/blog", dependencies=[Depends(require_auth)])
 async def create_blog_post(post: BlogPost):
-    post.id = str(uuid.uuid4())
-    post.published_at = datetime.now()
-    result = blog_collection.insert_one(post.dict())
-    return {"id": post.id, "message": "Blog post created successfully"}
-
-@app.put("/api/blog/{post_id}")
-async def update_blog_post(post_id: str, post: BlogPost):
-    result = blog_collection.update_one(
-        {"id": post_id}, 
-        {"$set": post.dict(exclude={"id"})}
+    doc = {**post.model_dump(), "id": str(uuid.uuid4()),
+           "published_at": datetime.utcnow()}
+    await blog_collection.insert_one(doc)
+    return {"id": doc["id"], "message": "Blog post created successfully"}
+
+@app.put("/api/blog/{post_id}", dependencies=[Depends(require_auth)])
+async def update_blog_post(post_id: str, post: BlogPostUpdate):
+    changes = post.model_dump(exclude_unset=True)
+    if not changes:
+        return {"message": "No changes supplied"}
+    result = await blog_collection.update_one(
+        {"id": post_id},
+        {"$set": changes}
     )
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Blog post not found")
     return {"message": "Blog post updated successfully"}
 
-@app.delete("/api/blog/{post_id}")
+@app.delete("/api/blog/{post_id}", dependencies=[Depends(require_auth)])
 async def delete_blog_post(post_id: str):
-    result = blog_collection.delete_one({"id": post_id})
+    result = await blog_collection.delete_one({"id": post_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Blog post not found")
     return {"message": "Blog post deleted successfully"}
 
 # Testimonials endpoints
 @app.get("/api/testimonials")
-async def get_testimonials():
-    testimonials = list(testimonials_collection.find())
-    return [serialize_doc(testimonial) for testimonial in testimonials]
+async def get_testimonials(request: Request):
+    async def fetch():
+        cursor = testimonials_collection.find({}, NO_OBJECT_ID)
+        return [testimonial async for testimonial in cursor]
+    return await etag_response(request, "testimonials", fetch)
 
-@app.post("/api/testimonials")
+@app.post("/api/testimonials", dependencies=[Depends(require_auth)])
 async def create_testimonial(testimonial: Testimonial):
-    testimonial.id = str(uuid.uuid4())
-    result = testimonials_collection.insert_one(testimonial.dict())
-    return {"id": testimonial.id, "message": "Testimonial created successfully"}
-
-@app.put("/api/testimonials/{testimonial_id}")
-async def update_testimonial(testimonial_id: str, testimonial: Testimonial):
-    result = testimonials_collection.update_one(
-        {"id": testimonial_id}, 
-        {"$set": testimonial.dict(exclude={"id"})}
+    doc = {**testimonial.model_dump(), "id": str(uuid.uuid4())}
+    await testimonials_collection.insert_one(doc)
+    cache_invalidate("testimonials")
+    return {"id": doc["id"], "message": "Testimonial created successfully"}
+
+@app.put("/api/testimonials/{testimonial_id}", dependencies=[Depends(require_auth)])
+async def update_testimonial(testimonial_id: str, testimonial: TestimonialUpdate):
+    changes = testimonial.model_dump(exclude_unset=True)
+    if not changes:
+        return {"message": "No changes supplied"}
+    result = await testimonials_collection.update_one(
+        {"id": testimonial_id},
+        {"$set": changes}
     )
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Testimonial not found")
+    cache_invalidate("testimonials")
     return {"message": "Testimonial updated successfully"}
 
-@app.delete("/api/testimonials/{testimonial_id}")
+@app.delete("/api/testimonials/{testimonial_id}", dependencies=[Depends(require_auth)])
 async def delete_testimonial(testimonial_id: str):
-    result = testimonials_collection.delete_one({"id": testimonial_id})
+    result = await testimonials_collection.delete_one({"id": testimonial_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Testimonial not found")
+    cache_invalidate("testimonials")
     return {"message": "Testimonial deleted successfully"}
 
 # Settings endpoints
 @app.get("/api/settings")
-async def get_settings():
-    settings = settings_collection.find_one()
-    if not settings:
-        raise HTTPException(status_code=404, detail="Settings not found")
-    return serialize_doc(settings)
-
-@app.put("/api/settings")
+async def get_settings(request: Request):
+    async def fetch():
+        settings = await settings_collection.find_one({}, NO_OBJECT_ID)
+        if not settings:
+            raise HTTPException(status_code=404, detail="Settings not found")
+        return settings
+    return await etag_response(request, "settings", fetch)
+
+@app.put("/api/settings", dependencies=[Depends(require_auth)])
 async def update_settings(settings: Settings):
-    result = settings_collection.update_one(
-        {}, 
-        {"$set": settings.dict()}, 
+    result = await settings_collection.update_one(
+        {"id": "settings"},
+        {"$set": settings.model_dump()},
         upsert=True
     )
+    cache_invalidate("settings")
     return {"message": "Settings updated successfully"}
 
 # Contact endpoints
 @app.post("/api/contact")
 async def create_contact(contact: Contact):
-    contact.created_at = datetime.now()
-    result = contacts_collection.insert_one(contact.dict())
+    contact.created_at = datetime.utcnow()
+    result = await contacts_collection.insert_one(contact.model_dump())
     return {"message": "Contact form submitted successfully"}
 
 # Admin authentication endpoints
@@ -359,15 +589,39 @@ async def admin_login(credentials: dict):
     password = credentials.get("password", "")
     # Simple password check - in production, use proper hashing
     if password == "archviz2024!" or password == "rabiul-admin-2024":
-        return {"success": True, "message": "Login successful"}
+        token = jwt.encode(
+            {"sub": "admin", "exp": datetime.utcnow() + TOKEN_TTL},
+            get_jwt_secret(),
+            algorithm=JWT_ALGORITHM,
+        )
+        return {"success": True, "message": "Login successful", "token": token}
     else:
         raise HTTPException(status_code=401, detail="Invalid password")
 
 @app.get("/api/contacts")
-async def get_contacts():
-    contacts = list(contacts_collection.find().sort("created_at", -1))
-    return [serialize_doc(contact) for contact in contacts]
+async def get_contacts(limit: int = Query(50, ge=1, le=200),
+                       before: Optional[datetime] = None):
+    # Keyset pagination on the created_at index keeps this an O(limit)
+    # index walk no matter how many contacts accumulate
+    query = {"created_at": {"$lt": before}} if before else {}
+    cursor = (contacts_collection.find(query, NO_OBJECT_ID)
+              .sort("created_at", -1).limit(limit))
+    contacts = [contact async for contact in cursor]
+    next_cursor = contacts[-1]["created_at"] if len(contacts) == limit else None
+    return {"items": contacts, "next_cursor": next_cursor}
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
+    # One worker per core; uvloop/httptools replace the stdlib event loop
+    # and HTTP parser, and access logging is off so the hot path doesn't
+    # block on a logging call per request
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=8001,
+        workers=os.cpu_count(),
+        loop="uvloop",
+        http="httptools",
+        log_level="warning",
+        access_log=False,
+    )
\ No newline at end of file
@@ -3,6 +3,11 @@ import { motion, AnimatePresence } from 'framer-motion';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL || 'http://localhost:8001';
 
+// Write endpoints require the JWT issued at admin login
+const authHeader = () => ({
+  Authorization: `Bearer ${localStorage.getItem('admin_token')}`,
+});
+
 const AdminPanel = ({ onClose }) => {
   const [activeTab, setActiveTab] = useState('settings');
   const [settings, setSettings] = useState({});
@@ -50,6 +55,7 @@ const AdminPanel = ({ onClose }) => {
         method: 'PUT',
         headers: {
           'Content-Type': 'application/json',
+          ...authHeader(),
         },
         body: JSON.stringify(updatedSettings),
       });
@@ -76,6 +82,7 @@ const AdminPanel = ({ onClose }) => {
     try {
       const response = await fetch(`${BACKEND_URL}/api/${type}/${id}`, {
         method: 'DELETE',
+        headers: authHeader(),
       });
 
       if (response.ok) {
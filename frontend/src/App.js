@@ -33,19 +33,34 @@ function App() {
   }, []);
 
   // Admin login function
-  const handleAdminLogin = (e) => {
+  const handleAdminLogin = async (e) => {
     e.preventDefault();
-    // Simple password check (in production, this should be handled by backend)
-    if (adminPassword === 'archviz2024!' || adminPassword === 'rabiul-admin-2024') {
-      setIsAuthenticated(true);
-      setShowAdmin(true);
-      setShowAdminLogin(false);
-      setLoginError('');
-      // Update URL without the login path
-      window.history.pushState({}, '', '/');
-    } else {
-      setLoginError('Invalid password. Please try again.');
-      setAdminPassword('');
+    try {
+      const response = await fetch(`${BACKEND_URL}/api/admin/login`, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({ password: adminPassword }),
+      });
+
+      if (response.ok) {
+        const data = await response.json();
+        // Token is required by the admin write endpoints
+        localStorage.setItem('admin_token', data.token);
+        setIsAuthenticated(true);
+        setShowAdmin(true);
+        setShowAdminLogin(false);
+        setLoginError('');
+        // Update URL without the login path
+        window.history.pushState({}, '', '/');
+      } else {
+        setLoginError('Invalid password. Please try again.');
+        setAdminPassword('');
+      }
+    } catch (error) {
+      console.error('Error logging in:', error);
+      setLoginError('Login failed. Please try again.');
     }
   };
 
@@ -131,13 +146,39 @@ function App() {
       setBlogPosts(blogData);
       setTestimonials(testimonialsData);
       setSettings(settingsData);
-      setProjectCategories(['All', ...categoriesData]);
+      setProjectCategories(['All', ...categoriesData.map((category) => category.name)]);
     } catch (error) {
       console.error('Error fetching data:', error);
     }
   };
 
-  const filteredProjects = projectFilter === 'All' 
+  // List endpoints only return the fields the cards render; fetch the
+  // full document when a modal opens
+  const openProject = async (project) => {
+    setSelectedProject(project);
+    try {
+      const response = await fetch(`${BACKEND_URL}/api/projects/${project.id}`);
+      if (response.ok) {
+        setSelectedProject(await response.json());
+      }
+    } catch (error) {
+      console.error('Error fetching project details:', error);
+    }
+  };
+
+  const openBlogPost = async (post) => {
+    setSelectedBlogPost(post);
+    try {
+      const response = await fetch(`${BACKEND_URL}/api/blog/${post.id}`);
+      if (response.ok) {
+        setSelectedBlogPost(await response.json());
+      }
+    } catch (error) {
+      console.error('Error fetching blog post details:', error);
+    }
+  };
+
+  const filteredProjects = projectFilter === 'All'
     ? projects 
     : projects.filter(project => project.category === projectFilter);
 
@@ -666,7 +707,7 @@ function App() {
               animate={{ opacity: 1, y: 0 }}
               transition={{ delay: 0.1 * index, duration: 0.8 }}
               whileHover={{ scale: 1.02 }}
-              onClick={() => setSelectedProject(project)}
+              onClick={() => openProject(project)}
             >
               <div className="aspect-video overflow-hidden">
                 <img 
@@ -723,7 +764,7 @@ function App() {
               animate={{ opacity: 1, y: 0 }}
               transition={{ delay: 0.1 * index, duration: 0.8 }}
               whileHover={{ scale: 1.02 }}
-              onClick={() => setSelectedBlogPost(post)}
+              onClick={() => openBlogPost(post)}
             >
               <div className="aspect-video overflow-hidden">
                 <img 